@@ -21,11 +21,17 @@ import os
 import re
 import sys
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = "https://sentry.io/api/0"
 
@@ -47,6 +53,7 @@ STATE_PATH = getenv_clean("MONITOR_STATE_PATH", ".release_monitor_state.json")
 # ---- 표시 상수 ----
 TITLE_MAX = 90
 TOP_LIMIT = 5
+SLACK_TIMEOUT = (3.05, 10)  # (connect, read) 초 — 웹훅 지연이 tick을 붙잡지 않도록
 
 # ---- 공용 로깅 유틸 ----
 def pstep(prefix: str, idx: int, total: int, msg: str) -> None:
@@ -62,8 +69,56 @@ def now_utc() -> datetime:
 def to_iso(dt: datetime) -> str:
     return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
+@lru_cache(maxsize=256)
 def from_iso(s: str) -> datetime:
-    return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(UTC)
+    # 끝의 'Z'만 오프셋으로 치환 (3.11 미만 fromisoformat 호환), datetime은 불변이라 캐시 안전
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    return datetime.fromisoformat(s).astimezone(UTC)
+
+# ---- HTTP 세션 (커넥션 재사용 + 429/5xx 재시도) ----
+class CappedRetry(Retry):
+    """Retry-After를 존중하되 대기 시간은 RETRY_AFTER_CAP 초로 제한 (urllib3 2.5 고정 버전엔 retry_after_max 없음)"""
+    RETRY_AFTER_CAP = 5.0
+
+    def get_retry_after(self, response):  # type: ignore[override]
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_CAP)
+
+def make_session() -> requests.Session:
+    # Sentry: Retry-After는 회당 최대 5초, 읽기 타임아웃 재시도는 1회만 (60초 GET이 반복되지 않도록)
+    # 대기 최악 약 25초(backoff 0·1·2·4·8초 또는 상한 5초) + 요청 타임아웃 2회
+    retry = CappedRetry(total=5, read=1, backoff_factor=0.5,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        respect_retry_after_header=True, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    # Slack webhook: 429는 처리 전 거절이므로 POST도 재시도 (5xx는 중복 전송 위험 → 제외)
+    # 대기는 회당 최대 5초(Retry-After 상한/backoff 0·2·4초) → 최악 약 15초 + 요청 타임아웃
+    slack_retry = CappedRetry(total=3, read=0, backoff_factor=1, status_forcelist=[429],
+                        allowed_methods=frozenset({"POST"}),
+                        respect_retry_after_header=True, raise_on_status=False)
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.mount("https://hooks.slack.com/", HTTPAdapter(max_retries=slack_retry))
+    return s
+
+SESSION = make_session()
+DEFAULT_SENTRY_CONCURRENCY = 3
+MAX_SENTRY_CONCURRENCY = 3  # 모니터당 동시 조회 건수(릴리즈 기준 시간/스냅샷/Top 이슈)
+
+def read_sentry_concurrency(prefix: str) -> int:
+    """SENTRY_CONCURRENCY: 모니터당 3건의 Sentry 조회를 동시에 진행할 수 (1~3으로 제한, 1이면 순차 실행, 잘못된 값은 기본값)"""
+    raw = getenv_clean("SENTRY_CONCURRENCY")
+    if not raw:
+        return DEFAULT_SENTRY_CONCURRENCY
+    try:
+        return min(MAX_SENTRY_CONCURRENCY, max(1, int(raw)))
+    except ValueError:
+        psub(prefix, f"SENTRY_CONCURRENCY 값이 올바르지 않습니다({raw!r}) → 기본값 {DEFAULT_SENTRY_CONCURRENCY} 사용")
+        return DEFAULT_SENTRY_CONCURRENCY
 
 def auth_headers(tok: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {tok}"}
@@ -109,7 +164,7 @@ def resolve_project_id(token: str, org: str, slug: Optional[str], id_env: Option
     if not slug:
         raise SystemExit("SENTRY_PROJECT_SLUG 또는 SENTRY_PROJECT_ID 중 하나는 필요합니다.")
     url = f"{API_BASE}/organizations/{org}/projects/"
-    r = ensure_ok(requests.get(url, headers=auth_headers(token), timeout=30))
+    r = ensure_ok(SESSION.get(url, headers=auth_headers(token), timeout=30))
     for p in r.json():
         if p.get("slug") == slug:
             return int(p.get("id"))
@@ -118,30 +173,34 @@ def resolve_project_id(token: str, org: str, slug: Optional[str], id_env: Option
 # ---- 릴리즈 목록/매칭 ----
 SEMVER_CORE = re.compile(r"^\d+\.\d+\.\d+$")
 
-def list_releases_paginated(token: str, org: str, project_id: int, per_page: int=100, max_pages: int=10) -> List[Dict[str, Any]]:
-    url = f"{API_BASE}/organizations/{org}/releases/"
-    out: List[Dict[str, Any]] = []
-    headers = auth_headers(token)
-    cursor = None
+def iter_paginated(url: str, headers: Dict[str, str], params: Dict[str, Any],
+                   max_pages: int=10) -> Iterator[Dict[str, Any]]:
+    """Link 헤더(rel="next"; results="true"; cursor=...)를 따라가며 항목을 순차 yield"""
+    params = dict(params)
     pages = 0
     while True:
         pages += 1
-        params = {"project": project_id, "per_page": min(max(per_page,1),100)}
-        if cursor: params["cursor"] = cursor
-        r = ensure_ok(requests.get(url, headers=headers, params=params, timeout=60))
+        r = ensure_ok(SESSION.get(url, headers=headers, params=params, timeout=60))
         arr = r.json() or []
-        out.extend(arr)
-        link = r.headers.get("link","")
-        nxt = None
-        if 'rel="next"' in link and 'results="true"' in link:
-            m = re.search(r'cursor="?([^">]+)"?', link)
-            nxt = m.group(1) if m else None
-            if nxt and ":-1:" in nxt:
-                nxt = None
-        cursor = nxt
-        if not cursor or not arr or pages >= max_pages:
-            break
-    return out
+        yield from arr
+        nxt_link = r.links.get("next") or {}
+        nxt = nxt_link.get("cursor") if nxt_link.get("results") == "true" else None
+        if nxt and ":-1:" in nxt:
+            nxt = None
+        if not nxt or not arr or pages >= max_pages:
+            return
+        params["cursor"] = nxt
+
+def list_releases_paginated(token: str, org: str, project_id: int, per_page: int=100, max_pages: int=10) -> List[Dict[str, Any]]:
+    url = f"{API_BASE}/organizations/{org}/releases/"
+    params = {"project": project_id, "per_page": min(max(per_page,1),100)}
+    return list(iter_paginated(url, auth_headers(token), params, max_pages=max_pages))
+
+@lru_cache(maxsize=None)
+def release_versions(token: str, org: str, project_id: int) -> Tuple[str, ...]:
+    """프로젝트 릴리즈 버전명 목록(실행 중 캐시 → 여러 모니터가 한 번의 목록 조회를 공유)"""
+    rels = list_releases_paginated(token, org, project_id, per_page=100, max_pages=10)
+    return tuple(str(r.get("version") or r.get("shortVersion") or "").strip() for r in rels)
 
 def match_full_release(token: str, org: str, project_id: int, base_release: str) -> Optional[str]:
     """
@@ -149,12 +208,7 @@ def match_full_release(token: str, org: str, project_id: int, base_release: str)
     """
     if not SEMVER_CORE.match(base_release):
         raise SystemExit(f"base-release 형식이 올바르지 않습니다: {base_release}")
-    rels = list_releases_paginated(token, org, project_id, per_page=100, max_pages=10)
-    cands = []
-    for r in rels:
-        name = str(r.get("version") or r.get("shortVersion") or "").strip()
-        if name.startswith(base_release):
-            cands.append(name)
+    cands = [name for name in release_versions(token, org, project_id) if name.startswith(base_release)]
     if not cands:
         return None
     def build_num(v: str) -> int:
@@ -164,35 +218,41 @@ def match_full_release(token: str, org: str, project_id: int, base_release: str)
             except Exception:
                 return 0
         return 0
-    cands.sort(key=build_num, reverse=True)
-    return cands[0]
+    # 최신 1개만 필요 → 전체 정렬 대신 O(n) 선형 탐색 (동률이면 목록 앞쪽 우선, 기존 정렬과 동일)
+    return max(cands, key=build_num)
 
-def get_release_created_at(token: str, org: str, project_id: int, version: str) -> Optional[datetime]:
-    """릴리즈 생성/배포 시간(있으면 dateReleased, 없으면 dateCreated)"""
+def get_release_created_at(token: str, org: str, project_id: int, version: str) -> Tuple[Optional[datetime], bool]:
+    """릴리즈 생성/배포 시간(있으면 dateReleased, 없으면 dateCreated) + dateReleased 사용 여부"""
     url = f"{API_BASE}/organizations/{org}/releases/{version}/"
-    r = ensure_ok(requests.get(url, headers=auth_headers(token), params={"project": project_id}, timeout=30))
+    r = ensure_ok(SESSION.get(url, headers=auth_headers(token), params={"project": project_id}, timeout=30))
     obj = r.json() or {}
-    ts = obj.get("dateReleased") or obj.get("dateCreated")
-    return from_iso(ts) if ts else None
+    released = obj.get("dateReleased")
+    ts = released or obj.get("dateCreated")
+    return (from_iso(ts) if ts else None), bool(released)
 
 # ---- Discover 집계(윈도우) ----
 LEVEL_QUERY = "level:[error,fatal]"
 
-def window_aggregates(token: str, org: str, project_id: int, environment: Optional[str],
-                      release_full: str, start_iso: str, end_iso: str) -> Dict[str, Any]:
-    url = f"{API_BASE}/organizations/{org}/events/"
+@lru_cache(maxsize=None)
+def release_query(release_full: str, environment: Optional[str]) -> str:
+    """level + release (+ env) 검색 쿼리 — tick 내 집계/Top/액션 URL이 공유"""
     q = [LEVEL_QUERY, f"release:{release_full}"]
     if environment:
         q.append(f"environment:{environment}")
+    return " ".join(q)
+
+def window_aggregates(token: str, org: str, project_id: int, environment: Optional[str],
+                      release_full: str, start_iso: str, end_iso: str) -> Dict[str, Any]:
+    url = f"{API_BASE}/organizations/{org}/events/"
     params = {
         "field": ["count()", "count_unique(issue)", "count_unique(user)"],
         "project": project_id,
         "start": start_iso,
         "end": end_iso,
-        "query": " ".join(q),
+        "query": release_query(release_full, environment),
         "referrer": "api.release.monitor.agg",
     }
-    r = ensure_ok(requests.get(url, headers=auth_headers(token), params=params, timeout=60))
+    r = ensure_ok(SESSION.get(url, headers=auth_headers(token), params=params, timeout=60))
     rows = (r.json().get("data") or [])
     if not rows:
         return {"events": 0, "issues": 0, "users": 0}
@@ -206,21 +266,19 @@ def window_aggregates(token: str, org: str, project_id: int, environment: Option
 def window_top_issues(token: str, org: str, project_id: int, environment: Optional[str],
                       release_full: str, start_iso: str, end_iso: str, limit: int=TOP_LIMIT) -> List[Dict[str, Any]]:
     url = f"{API_BASE}/organizations/{org}/events/"
-    q = [LEVEL_QUERY, f"release:{release_full}"]
-    if environment:
-        q.append(f"environment:{environment}")
     params = {
         "field": ["issue.id", "issue", "title", "count()", "count_unique(user)"],
         "project": project_id,
         "start": start_iso,
         "end": end_iso,
-        "query": " ".join(q),
+        "query": release_query(release_full, environment),
         "orderby": "-count()",
         "per_page": min(max(limit,1),100),
         "referrer": "api.release.monitor.top",
     }
-    r = ensure_ok(requests.get(url, headers=auth_headers(token), params=params, timeout=60))
+    r = ensure_ok(SESSION.get(url, headers=auth_headers(token), params=params, timeout=60))
     rows = r.json().get("data") or []
+    issue_url_prefix = f"https://sentry.io/organizations/{org}/issues/"
     out = []
     for row in rows[:limit]:
         iid = str(row.get("issue.id") or "")
@@ -230,7 +288,7 @@ def window_top_issues(token: str, org: str, project_id: int, environment: Option
             "title": row.get("title"),
             "events": int(row.get("count()") or 0),
             "users": int(row.get("count_unique(user)") or 0),
-            "link": f"https://sentry.io/organizations/{org}/issues/{iid}/" if iid else None,
+            "link": issue_url_prefix + iid + "/" if iid else None,
         })
     return out
 
@@ -240,13 +298,8 @@ def build_action_urls(org: str, project_id: int, environment: Optional[str],
     # 대시보드(커스텀 있으면 우선)
     dash = getenv_clean("SENTRY_DASHBOARD_URL") or f"https://sentry.io/organizations/{org}/projects/"
     # 이슈 필터 (release + level + env + 기간)
-    from urllib.parse import quote_plus
-    q = [LEVEL_QUERY, f"release:{release_full}"]
-    if environment:
-        q.append(f"environment:{environment}")
-    qstr = quote_plus(" ".join(q))
-    s = quote_plus(start_iso); e = quote_plus(end_iso)
-    issues_url = f"https://sentry.io/organizations/{org}/issues/?project={project_id}&query={qstr}&start={s}&end={e}"
+    qs = urlencode({"project": project_id, "query": release_query(release_full, environment), "start": start_iso, "end": end_iso})
+    issues_url = f"https://sentry.io/organizations/{org}/issues/?{qs}"
     return {"dashboard": dash, "issues": issues_url}
 
 def build_slack_blocks(release_label: str,
@@ -280,12 +333,11 @@ def build_slack_blocks(release_label: str,
 
     if top5:
         blocks.append({"type":"section","text":{"type":"mrkdwn","text": bold(":sports_medal: 윈도우 Top5 이슈")}})
-        lines = []
-        for it in top5:
-            title = truncate(it.get("title"), TITLE_MAX)
-            head = f"• <{it.get('link')}|{title}> · {it.get('events',0)}건 · {it.get('users',0)}명"
-            lines.append(head)
-        blocks.append({"type":"section","text":{"type":"mrkdwn","text":"\n".join(lines)}})
+        lines = "\n".join(
+            f"• <{it.get('link')}|{truncate(it.get('title'), TITLE_MAX)}> · {it.get('events',0)}건 · {it.get('users',0)}명"
+            for it in top5
+        )
+        blocks.append({"type":"section","text":{"type":"mrkdwn","text":lines}})
 
     # 액션 버튼
     blocks.append({"type":"actions","elements":[
@@ -297,13 +349,37 @@ def build_slack_blocks(release_label: str,
 
 def post_slack(webhook: str, blocks: List[Dict[str,Any]]) -> None:
     payload = {"blocks": blocks}
-    r = requests.post(webhook, headers={"Content-Type":"application/json"}, data=json.dumps(payload), timeout=30)
+    # 한글이 \uXXXX 로 부풀지 않도록 UTF-8 그대로, 공백 없이 직렬화
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    r = SESSION.post(webhook, headers={"Content-Type":"application/json; charset=utf-8"}, data=body, timeout=SLACK_TIMEOUT)
     try:
         r.raise_for_status()
         print("[Slack] 전송 완료.")
     except requests.HTTPError as e:
-        print(f"[Slack] Post failed {r.status_code}: {r.text[:300]}")
-        raise
+        # 상세는 tick 종료 시 요약으로 한 번에 (HTTP 실패 메시지에는 webhook URL을 넣지 않음)
+        raise requests.HTTPError(f"Slack HTTP {r.status_code}: {r.text[:300]}", response=r) from e
+
+def failure_fingerprint(e: BaseException) -> str:
+    """실패 묶음 키: HTTP 응답이 있으면 상태 코드, 없으면 예외 타입"""
+    resp = getattr(e, "response", None)
+    if resp is not None:
+        return f"HTTP {resp.status_code}"
+    return type(e).__name__
+
+def failure_detail(e: BaseException, webhook: str) -> str:
+    """요약 샘플 문구: 예외 메시지 그대로, 단 webhook URL/경로(비밀값)는 가림 (ConnectionError 등은 URL 경로를 포함)"""
+    msg = f"{type(e).__name__}: {e}"
+    for secret in (webhook, urlsplit(webhook).path):
+        if len(secret) > 1:
+            msg = msg.replace(secret, "<webhook>")
+    return truncate(msg, 200)
+
+def summarize_failures(prefix: str, label: str, failures: List[Tuple[str, BaseException]], webhook: str, samples: int=5) -> None:
+    counts = Counter(failure_fingerprint(e) for _, e in failures)
+    kinds = ", ".join(f"{k} × {v}" for k, v in counts.most_common())
+    psub(prefix, f"⚠️ {label} 실패 {len(failures)}건 ({kinds})")
+    for mid, e in failures[:samples]:
+        psub(prefix, f"  id={mid}: {failure_detail(e, webhook)}")
 
 # ---- 모니터 런타임 ----
 def create_monitor(platform: str, base_release: str, days: int=7) -> Dict[str,Any]:
@@ -314,6 +390,7 @@ def create_monitor(platform: str, base_release: str, days: int=7) -> Dict[str,An
         "platform": platform,
         "base_release": base_release,  # 사용자가 입력한 semver core
         "matched_release": None,       # tick에서 채워짐
+        "release_released_at": None,   # tick에서 채워짐(dateReleased가 확정된 경우에만 저장, 이후 재조회 생략)
         "started_at": to_iso(now),
         "expires_at": to_iso(now + timedelta(days=days)),
         "last_run_at": None,
@@ -327,9 +404,9 @@ def pick_cadence(rec: Dict[str,Any]) -> Tuple[timedelta, str]:
     # 모든 기간 1시간 간격으로 통일
     return timedelta(hours=1), "1시간"
 
-def compute_window(rec: Dict[str,Any]) -> Tuple[datetime, datetime]:
-    """last_window_end 이후 ~ now, 단 최소 5분/최대 2시간 가드"""
-    nowt = now_utc()
+def compute_window(rec: Dict[str,Any], nowt: Optional[datetime]=None) -> Tuple[datetime, datetime]:
+    """last_window_end 이후 ~ now, 단 최소 5분/최대 2시간 가드 (nowt: tick 기준 시각 재사용)"""
+    nowt = nowt or now_utc()
     last_end = from_iso(rec["last_window_end"]) if rec.get("last_window_end") else None
     if last_end:
         start = last_end
@@ -377,12 +454,13 @@ def cmd_tick(args: List[str]) -> None:
 
     # 필수 ENV
     pstep("Monitor-Tick", 2, TOTAL, "환경 변수 수집…")
-    token = (getenv_clean("SENTRY_AUTH_TOKEN") or "").strip()
-    org   = (getenv_clean("SENTRY_ORG_SLUG") or "").strip()
-    project_slug = (getenv_clean("SENTRY_PROJECT_SLUG") or "").strip()
-    project_id_env = (getenv_clean("SENTRY_PROJECT_ID") or "").strip()
-    environment = (getenv_clean("SENTRY_ENVIRONMENT") or "").strip() or None
-    webhook = (getenv_clean("SLACK_MONITORING_WEBHOOK_URL") or "").strip()
+    token = getenv_clean("SENTRY_AUTH_TOKEN")
+    org   = getenv_clean("SENTRY_ORG_SLUG")
+    project_slug = getenv_clean("SENTRY_PROJECT_SLUG")
+    project_id_env = getenv_clean("SENTRY_PROJECT_ID")
+    environment = getenv_clean("SENTRY_ENVIRONMENT") or None
+    webhook = getenv_clean("SLACK_MONITORING_WEBHOOK_URL")
+    concurrency = read_sentry_concurrency("Monitor-Tick")
 
     if not token or not org or (not project_slug and not project_id_env) or not webhook:
         raise SystemExit("필수 ENV 누락: SENTRY_AUTH_TOKEN / SENTRY_ORG_SLUG / (SENTRY_PROJECT_ID|SENTRY_PROJECT_SLUG) / SLACK_MONITORING_WEBHOOK_URL")
@@ -416,77 +494,85 @@ def cmd_tick(args: List[str]) -> None:
 
     pstep("Monitor-Tick", 6, TOTAL, f"활성 모니터 처리 시작 (총 {len(active)}개)…")
 
-    for idx, m in enumerate(active, start=1):
-        prefix = f"Monitor-Tick:{idx}/{len(active)}"
-        psub(prefix, f"대상 id={m['id']} base={m['base_release']} platform={m.get('platform')}")
-        # 릴리즈 매칭
-        psub(prefix, "base→full 버전 매칭 시도…")
-        base = m["base_release"]
-        full = m.get("matched_release") or match_full_release(token, org, project_id, base)
-        if not full:
-            psub(prefix, f"매칭 실패 → 스킵(base={base})")
-            continue
-        m["matched_release"] = full
-        psub(prefix, f"매칭 결과 full={full}")
-
-        # 릴리즈 기준 시간
-        psub(prefix, "릴리즈 기준 시간 조회…")
-        rel_created = get_release_created_at(token, org, project_id, full)
-        rel_label = f"{full} (기준시: {to_iso(rel_created) if rel_created else 'N/A'})"
-
-        # 집계 창 계산
-        psub(prefix, "집계 윈도우 계산…")
-        win_s, win_e = compute_window(m)
-        win_s_iso, win_e_iso = to_iso(win_s), to_iso(win_e)
-        win_label = f"{win_s.astimezone(KST).strftime('%Y-%m-%d %H:%M')} ~ {win_e.astimezone(KST).strftime('%Y-%m-%d %H:%M')} (KST)"
-        cad_td, cad_label = pick_cadence(m)
-        psub(prefix, f"window={win_s_iso} ~ {win_e_iso} · cadence={cad_label}")
-
-        # 스냅샷 집계
-        psub(prefix, "스냅샷 집계(events/issues/users)…")
-        snap = window_aggregates(token, org, project_id, environment, full, win_s_iso, win_e_iso)
-        psub(prefix, f"snapshot={snap}")
-
-        # 상위 이슈
-        psub(prefix, f"Top{TOP_LIMIT} 이슈 수집…")
-        top5 = window_top_issues(token, org, project_id, environment, full, win_s_iso, win_e_iso, TOP_LIMIT)
-        psub(prefix, f"top_count={len(top5)}")
-
-        # 델타/누적
-        last_snap = m.get("last_snapshot") or {"events":0,"issues":0,"users":0}
-        delta = {
-            "events": snap["events"] - last_snap.get("events",0),
-            "issues": snap["issues"] - last_snap.get("issues",0),
-            "users":  snap["users"]  - last_snap.get("users",0),
-        }
-        cumul = m.get("cumul") or {"events":0,"issues":0,"users":0}
-        cumul = {
-            "events": cumul.get("events",0) + snap["events"],
-            "issues": cumul.get("issues",0) + snap["issues"],
-            "users":  cumul.get("users",0)  + snap["users"],
-        }
-        psub(prefix, f"delta={delta} · cumul={cumul}")
-
-        # 액션 URL/Slack 전송
-        psub(prefix, "액션 URL 생성(dashboard/issues)…")
-        actions = build_action_urls(org, project_id, environment, full, win_s_iso, win_e_iso)
-        psub(prefix, "Slack 전송…")
-        try:
-            blocks = build_slack_blocks(release_label=rel_label,
-                                        window_label=win_label,
-                                        snapshot=snap, deltas=delta, cumuls=cumul,
-                                        top5=top5, action_urls=actions, cadence_label=cad_label)
-            post_slack(webhook, blocks)
-        except Exception as e:
-            psub(prefix, f"Slack 전송 실패(무시하고 상태 갱신): {e}")
-
-        # 상태 업데이트
-        psub(prefix, "상태 업데이트…")
-        m["last_run_at"] = to_iso(now_utc())
-        m["last_window_end"] = win_e_iso
-        m["last_snapshot"] = snap
-        m["cumul"] = cumul
-        psub(prefix, "완료")
+    slack_failures: List[Tuple[str, BaseException]] = []
+    # tick 전체에서 풀 하나를 공유 (모니터당 동시 조회는 최대 3건)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for idx, m in enumerate(active, start=1):
+            prefix = f"Monitor-Tick:{idx}/{len(active)}"
+            psub(prefix, f"대상 id={m['id']} base={m['base_release']} platform={m.get('platform')}")
+            # 릴리즈 매칭
+            psub(prefix, "base→full 버전 매칭 시도…")
+            base = m["base_release"]
+            full = m.get("matched_release") or match_full_release(token, org, project_id, base)
+            if not full:
+                psub(prefix, f"매칭 실패 → 스킵(base={base})")
+                continue
+            m["matched_release"] = full
+            psub(prefix, f"매칭 결과 full={full}")
+
+            # 집계 창 계산
+            psub(prefix, "집계 윈도우 계산…")
+            win_s, win_e = compute_window(m, nowi)
+            win_s_iso, win_e_iso = to_iso(win_s), to_iso(win_e)
+            win_label = f"{win_s.astimezone(KST).strftime('%Y-%m-%d %H:%M')} ~ {win_e.astimezone(KST).strftime('%Y-%m-%d %H:%M')} (KST)"
+            cad_td, cad_label = pick_cadence(m)
+            psub(prefix, f"window={win_s_iso} ~ {win_e_iso} · cadence={cad_label}")
+
+            # 릴리즈 기준 시간/스냅샷/상위 이슈는 서로 독립 → 동시 조회
+            psub(prefix, f"릴리즈 기준 시간 · 스냅샷 집계(events/issues/users) · Top{TOP_LIMIT} 이슈 동시 조회…")
+            cached_rel = m.get("release_released_at")
+            f_rel = None if cached_rel else pool.submit(get_release_created_at, token, org, project_id, full)
+            f_snap = pool.submit(window_aggregates, token, org, project_id, environment, full, win_s_iso, win_e_iso)
+            f_top = pool.submit(window_top_issues, token, org, project_id, environment, full, win_s_iso, win_e_iso, TOP_LIMIT)
+            rel_created, rel_released = (from_iso(cached_rel), True) if cached_rel else f_rel.result()
+            snap = f_snap.result()
+            top5 = f_top.result()
+            # dateCreated 폴백 값은 이후 dateReleased로 바뀔 수 있으므로 저장하지 않고 다음 tick에 재조회
+            if rel_created and rel_released and not cached_rel:
+                m["release_released_at"] = to_iso(rel_created)
+            rel_label = f"{full} (기준시: {to_iso(rel_created) if rel_created else 'N/A'})"
+            psub(prefix, f"snapshot={snap}")
+            psub(prefix, f"top_count={len(top5)}")
+
+            # 델타/누적
+            last_snap = m.get("last_snapshot") or {"events":0,"issues":0,"users":0}
+            delta = {
+                "events": snap["events"] - last_snap.get("events",0),
+                "issues": snap["issues"] - last_snap.get("issues",0),
+                "users":  snap["users"]  - last_snap.get("users",0),
+            }
+            cumul = m.get("cumul") or {"events":0,"issues":0,"users":0}
+            cumul = {
+                "events": cumul.get("events",0) + snap["events"],
+                "issues": cumul.get("issues",0) + snap["issues"],
+                "users":  cumul.get("users",0)  + snap["users"],
+            }
+            psub(prefix, f"delta={delta} · cumul={cumul}")
+
+            # 액션 URL/Slack 전송
+            psub(prefix, "액션 URL 생성(dashboard/issues)…")
+            actions = build_action_urls(org, project_id, environment, full, win_s_iso, win_e_iso)
+            psub(prefix, "Slack 전송…")
+            try:
+                blocks = build_slack_blocks(release_label=rel_label,
+                                            window_label=win_label,
+                                            snapshot=snap, deltas=delta, cumuls=cumul,
+                                            top5=top5, action_urls=actions, cadence_label=cad_label)
+                post_slack(webhook, blocks)
+            except Exception as e:
+                psub(prefix, f"Slack 전송 실패(무시하고 상태 갱신): {failure_fingerprint(e)} → 상세는 종료 시 요약")
+                slack_failures.append((m["id"], e))
+
+            # 상태 업데이트
+            psub(prefix, "상태 업데이트…")
+            m["last_run_at"] = to_iso(now_utc())
+            m["last_window_end"] = win_e_iso
+            m["last_snapshot"] = snap
+            m["cumul"] = cumul
+            psub(prefix, "완료")
+
+    if slack_failures:
+        summarize_failures("Monitor-Tick", "Slack 전송", slack_failures, webhook)
 
     pstep("Monitor-Tick", 7, TOTAL, "상태 저장…")
     st["monitors"] = mons
@@ -495,17 +581,16 @@ def cmd_tick(args: List[str]) -> None:
     pstep("Monitor-Tick", 12, TOTAL, "모든 활성 모니터 처리 완료.")
 
 # ---- 엔트리 ----
+COMMANDS = {"start": cmd_start, "tick": cmd_tick}
+
 def main():
-    if len(sys.argv) < 2 or sys.argv[1] not in ("start","tick"):
+    handler = COMMANDS.get(sys.argv[1]) if len(sys.argv) >= 2 else None
+    if handler is None:
         print("Usage:")
         print("  python sentry_release_monitor.py start --platform {android|ios} --base-release 4.69.0 [--days 7]")
         print("  python sentry_release_monitor.py tick")
         sys.exit(1)
-    cmd = sys.argv[1]
-    if cmd == "start":
-        cmd_start(sys.argv[2:])
-    else:
-        cmd_tick(sys.argv[2:])
+    handler(sys.argv[2:])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file